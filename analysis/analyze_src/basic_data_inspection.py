@@ -1,6 +1,88 @@
 from abc import ABC, abstractmethod
+from functools import lru_cache
+import io
+import weakref
 import pandas as pd
 
+# Inspected dataframes by id(). Held weakly so the cache below never keeps a dataframe alive.
+_inspected_frames = weakref.WeakValueDictionary()
+
+
+def _backing_arrays(df: pd.DataFrame) -> list:
+  """
+    Returns the arrays holding the dataframe's data, one per internal block.
+
+    Replacing a column (e.g. df['a'] = df['a'] * 2) swaps in a new array, so their identities change with it.
+  """
+  return [block.values for block in df._mgr.blocks]
+
+
+@lru_cache(maxsize=32)
+def _cached_inspection_text(render, df_id, shape, dtypes, non_null_counts, block_layout):
+  """
+    Renders (or returns the cached) inspection text for a registered dataframe.
+
+    Parameters:
+    render (callable): Function turning the dataframe into the text to print.
+    df_id (int): id() of the dataframe, registered in _inspected_frames.
+    shape (tuple): Shape of the dataframe.
+    dtypes (tuple): (column, dtype) pairs of the dataframe.
+    non_null_counts (tuple): Non-null count of every column.
+    block_layout (tuple): (id of the backing array, column positions) of every block.
+
+    Returns:
+    tuple: The rendered inspection text and weak references to the backing arrays it was rendered from.
+  """
+  df = _inspected_frames[df_id]
+  return render(df), tuple(weakref.ref(array) for array in _backing_arrays(df))
+
+
+def _inspection_text(render, df: pd.DataFrame) -> str:
+  """
+    Returns the inspection text for df, recomputing it when the dataframe, its shape, dtypes, non-null counts or
+    any of its columns were replaced. Element-wise writes into an existing column (e.g. df.loc[0, 'a'] = 5) keep
+    the same backing array and are not detected.
+
+    Parameters:
+    render (callable): Function turning the dataframe into the text to print.
+    df (pd.DataFrame): The dataframe to be inspected.
+
+    Returns:
+    str: The rendered inspection text.
+  """
+  if _inspected_frames.get(id(df)) is not df:
+    _inspected_frames[id(df)] = df
+    # id() values are reused once a dataframe is collected, so drop the cached texts along with it.
+    weakref.finalize(df, _cached_inspection_text.cache_clear)
+  dtypes = tuple((str(column), str(dtype)) for column, dtype in df.dtypes.items())
+  # Counting non-nulls is a cheap pass compared to describe(), and catches in-place fillna/assignments of NaN.
+  non_null_counts = tuple(df.count().tolist())
+  arrays = _backing_arrays(df)
+  block_layout = tuple(
+    (id(array), tuple(block.mgr_locs.as_array.tolist())) for array, block in zip(arrays, df._mgr.blocks)
+  )
+  text, array_refs = _cached_inspection_text(render, id(df), df.shape, dtypes, non_null_counts, block_layout)
+  # A replaced column's array can be freed and its id() reused by the new one; the weak references tell them apart.
+  if any(ref() is not array for ref, array in zip(array_refs, arrays)):
+    return render(df)
+  return text
+
+
+def _render_info(df: pd.DataFrame) -> str:
+  buffer = io.StringIO()
+  df.info(buf=buffer)
+  return buffer.getvalue()
+
+
+def _render_summary(df: pd.DataFrame) -> str:
+  # Describe numerical and categorical features in a single pass. Text columns are cast to category so their
+  # unique/top/freq counts run over integer codes rather than Python strings.
+  object_columns = df.select_dtypes(include=["O"]).columns
+  if len(object_columns) > 0:
+    df = df.astype({column: "category" for column in object_columns})
+  return str(df.describe(include="all", percentiles=[.25, .5, .75]))
+
+
 # Abstract class for data inspection strategy
 class DataInspectionStrategy(ABC):
     @abstractmethod
@@ -28,7 +110,8 @@ class DataTypeInspectionStrategy(DataInspectionStrategy):
       None: Prints the data types and non-null counts to the console.
     """
     print("\nData types and non-null counts:")
-    print(df.info())
+    # Not cached: non-null counts are what this strategy reports, so it must always reflect the current data.
+    print(_render_info(df))
 
 class SummaryStatisticInspectionStrategy(DataInspectionStrategy):
   def inspect(self, df: pd.DataFrame):
@@ -41,10 +124,8 @@ class SummaryStatisticInspectionStrategy(DataInspectionStrategy):
       Returns:
       None: Prints summary of numerical and Categorical Features.  
     """
-    print("\nSummary statistics (Numerical Features):")
-    print(df.describe())
-    print("\nSummary statistics (Categorical Features):")
-    print(df.describe(include=["O"]))
+    print("\nSummary statistics (Numerical and Categorical Features):")
+    print(_inspection_text(_render_summary, df))
 
 # Context class for the data inspection strategy:
 class DataInspector:
@@ -1,7 +1,7 @@
 from abc import ABC, abstractmethod
+import numpy as np
 import pandas as pd
 import matplotlib.pyplot as plt
-import seaborn as sns
 
 # Abstract base template class for missing values analysis
 class MissingValuesAnalysisTemplate(ABC):
@@ -48,23 +48,52 @@ class MissingValuesAnalysisTemplate(ABC):
 
 # Concrete class for missing values analysis
 class SimpleMissingValuesAnalysis(MissingValuesAnalysisTemplate):
+  # Rows beyond this are mean-pooled before plotting the missing values heatmap.
+  MAX_PLOT_ROWS = 2000
+
   def identify_missing_values(self, df: pd.DataFrame):
     # Identify missing values in the dataframe
-    res = pd.DataFrame()
-    res['missing_values'] = df.isnull().sum()
-    res = res[res['missing_values'] > 0]
-    # print(f"\nMissing Values count by column:\n{missing_values}")
+    # Float columns are counted with a single np.isnan reduction over their 2-D array; only the remaining
+    # columns go through isna().
+    float_columns = df.select_dtypes(include=[np.floating]).columns
+    other_columns = df.columns.difference(float_columns, sort=False)
+    missing_counts = {}
+    if len(float_columns) > 0:
+      missing_counts.update(zip(float_columns, np.isnan(df[float_columns].to_numpy()).sum(axis=0)))
+    if len(other_columns) > 0:
+      missing_counts.update(df[other_columns].isna().sum().items())
 
-    res['missing_values_percentage'] = (res['missing_values'] / len(df)) * 100
-    # print(f"\nMissing Values percentage by column:\n{missing_values_percentage}")
+    # Keep only the columns that actually have missing values, in their original order.
+    missing_values = pd.Series(
+      {column: missing_counts[column] for column in df.columns if missing_counts[column] > 0}, dtype='int64'
+    )
+    res = pd.DataFrame({
+      'missing_values': missing_values,
+      'missing_values_percentage': (missing_values / len(df)) * 100,
+    })
     print(f"\nMissing Values percentage by column:\n{res}")
 
   def plot_missing_values(self, df: pd.DataFrame):
     # Plot missing values in the dataframe
     print("Visualizing missing values...")
-    plt.figure(figsize=(12, 8))
-    sns.heatmap(df.isnull(), cbar=False, cmap='viridis')
-    plt.title("Missing values heatmap")
+    mask = df.isna().to_numpy()
+    n_rows = mask.shape[0]
+    if n_rows > self.MAX_PLOT_ROWS:
+      # Mean-pool consecutive rows so the image keeps roughly one row per pixel; each cell then shows the
+      # fraction of missing values in its block.
+      block_size = -(-n_rows // self.MAX_PLOT_ROWS)
+      starts = np.arange(0, n_rows, block_size)
+      counts = np.diff(np.append(starts, n_rows))
+      mask = np.add.reduceat(mask, starts, axis=0, dtype=np.int64) / counts[:, None]
+
+    # A single rasterized mesh instead of one seaborn cell per value.
+    fig, ax = plt.subplots(figsize=(12, 8))
+    mesh = ax.pcolormesh(mask.astype(np.float32), cmap='viridis', rasterized=True)
+    fig.colorbar(mesh)
+    ax.invert_yaxis()
+    ax.set_xticks(np.arange(len(df.columns)) + 0.5)
+    ax.set_xticklabels(df.columns, rotation=90)
+    ax.set_title("Missing values heatmap")
     plt.show()
 
   
\ No newline at end of file
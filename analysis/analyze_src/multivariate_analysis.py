@@ -1,6 +1,7 @@
 from abc import ABC, abstractmethod
 
 import matplotlib.pyplot as plt
+import numpy as np
 import pandas as pd
 import seaborn as sns
 
@@ -51,6 +52,52 @@ class MultivariateAnalysisTemplate(ABC):
 
 # Concrete class for multivariate analysis
 class SimpleMultivariateAnalysis(MultivariateAnalysisTemplate):
+    # Larger dataframes are randomly subsampled to this many rows before plotting.
+    MAX_SAMPLE_ROWS = 5000
+    # Only the strongest correlations are annotated on the heatmap.
+    ANNOTATE_TOP_K = 20
+
+    def _numeric_sample(self, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Restrict the dataframe to its numeric columns and subsample it to at most MAX_SAMPLE_ROWS rows.
+
+        Parameters:
+        df (pd.DataFrame): The dataframe to sample.
+
+        Returns:
+        pd.DataFrame: The numeric subsample (deterministic via a fixed random_state).
+        """
+        numeric_df = df.select_dtypes(include='number')
+        if len(numeric_df) <= self.MAX_SAMPLE_ROWS:
+            return numeric_df
+        return numeric_df.sample(self.MAX_SAMPLE_ROWS, random_state=0)
+
+    def _pearson_corr(self, numeric_df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Compute the Pearson correlation matrix of a numeric dataframe.
+
+        Parameters:
+        numeric_df (pd.DataFrame): The numeric dataframe.
+
+        Returns:
+        pd.DataFrame: The correlation matrix, indexed by column on both axes.
+        """
+        # copy=True: the standardization below works in place and must not touch (or fail on) the caller's data.
+        values = numeric_df.to_numpy(dtype=np.float32, na_value=np.nan, copy=True)
+        if len(values) < 2 or np.isnan(values).any():
+            # Missing values need pandas' pairwise-complete handling.
+            return numeric_df.corr(method="pearson")
+
+        # Standardize in float32 and get every pairwise correlation from a single matrix product.
+        values -= values.mean(axis=0)
+        std = values.std(axis=0)
+        constant = std == 0
+        values /= np.where(constant, 1, std)
+        corr = np.clip((values.T @ values) / len(values), -1, 1)
+        corr[constant, :] = np.nan
+        corr[:, constant] = np.nan
+        return pd.DataFrame(corr, index=numeric_df.columns, columns=numeric_df.columns)
+
     def generate_correlation_heatmap(self, df: pd.DataFrame):
         """
         Generate a correlation heatmap for the dataframe.
@@ -61,9 +108,29 @@ class SimpleMultivariateAnalysis(MultivariateAnalysisTemplate):
         Returns:
         None: This method visualizes the correlation heatmap.
         """
-        plt.figure(figsize = (12,10))
-        sns.heatmap(df.corr(), annot = True, fmt=".2f", cmap="coolwarm", linewidths=0.5)
-        plt.title("Correlation Heatmap")
+        sample = self._numeric_sample(df)
+        corr = self._pearson_corr(sample)
+        values = corr.to_numpy()
+
+        # Draw the matrix as one rasterized mesh rather than a patch per cell.
+        fig, ax = plt.subplots(figsize = (12,10))
+        mesh = ax.pcolormesh(values, cmap="coolwarm", vmin=-1, vmax=1, rasterized=True)
+        fig.colorbar(mesh)
+        ax.invert_yaxis()
+        ticks = np.arange(len(corr.columns)) + 0.5
+        ax.set_xticks(ticks)
+        ax.set_xticklabels(corr.columns, rotation=90)
+        ax.set_yticks(ticks)
+        ax.set_yticklabels(corr.columns)
+
+        # Annotate the top-k off-diagonal pairs by |corr| (both mirrored cells) instead of every cell.
+        rows, cols = np.triu_indices_from(values, k=1)
+        strengths = np.nan_to_num(np.abs(values[rows, cols]), nan=-1)
+        for idx in np.argsort(strengths)[::-1][:self.ANNOTATE_TOP_K]:
+            i, j = rows[idx], cols[idx]
+            for y, x in ((i, j), (j, i)):
+                ax.text(x + 0.5, y + 0.5, f"{values[y, x]:.2f}", ha="center", va="center", fontsize=8)
+        ax.set_title("Correlation Heatmap")
         plt.show()
 
 
@@ -77,6 +144,6 @@ class SimpleMultivariateAnalysis(MultivariateAnalysisTemplate):
         Returns:
         None: This method visualizes the pair plot.
         """
-        sns.pairplot(df)
+        sns.pairplot(self._numeric_sample(df))
         plt.suptitle("Pair Plot of Selected Features", y=1.02)
         plt.show()
\ No newline at end of file
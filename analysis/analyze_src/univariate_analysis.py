@@ -1,9 +1,47 @@
 from abc import ABC, abstractmethod
+import os
+import re
 
+import joblib
+import numpy as np
 import pandas as pd
 import matplotlib.pyplot as plt
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+from scipy.stats import gaussian_kde
 import seaborn as sns
 
+# Characters replaced when turning a feature name (e.g. 'Year Remod/Add') into a file name.
+_FILENAME_UNSAFE = re.compile(r'[^\w.-]+')
+
+
+def _render_histogram(values: np.ndarray, feature: str, path: str, bins: int = 30) -> str:
+  """
+  Renders a histogram of the given values to a PNG file.
+
+  Uses a standalone Agg figure rather than pyplot, so it is safe to run in worker processes
+  without touching the interactive backend.
+
+  Parameters:
+  values (np.ndarray): The values of the feature.
+  feature (str): The feature name, used for the title and x label.
+  path (str): Where to write the PNG.
+  bins (int): Number of histogram bins.
+
+  Returns:
+  str: The path of the written PNG.
+  """
+  counts, edges = np.histogram(values[~np.isnan(values)], bins=bins)
+  fig = Figure(figsize=(10, 6))
+  FigureCanvasAgg(fig)
+  ax = fig.add_subplot()
+  ax.bar(edges[:-1], counts, width=np.diff(edges), align='edge')
+  ax.set_title(f"Distribution of {feature}")
+  ax.set_xlabel(feature)
+  ax.set_ylabel("Frequency")
+  fig.savefig(path)
+  return path
+
 
 # Abstract Base Class for Univariate Analysis Strategy
 # -----------------------------------------------------
@@ -28,6 +66,9 @@ class UnivariateAnalysisStrategy(ABC):
 # ---------------------------------------------------------
 # This class plots histogram for numerical features.
 class NumericalUnivariateAnalysis(UnivariateAnalysisStrategy):
+  # Maximum number of values the KDE curve is fitted on.
+  KDE_SAMPLE_SIZE = 10000
+
   def analyze(self, df:pd.DataFrame, feature:str):
     """
     Perform univariate analysis on the specified numerical feature of the dataframe.
@@ -39,13 +80,46 @@ class NumericalUnivariateAnalysis(UnivariateAnalysisStrategy):
     Returns:
     None: This method visualizes the distribution of the numerical feature.
     """
+    values = df[feature].to_numpy(dtype=np.float64, na_value=np.nan)
+    values = values[~np.isnan(values)]
+    counts, edges = np.histogram(values, bins=30)
+
     plt.figure(figsize=(10, 6))
-    sns.histplot(df[feature], kde=True, bins=30)
+    plt.bar(edges[:-1], counts, width=np.diff(edges), align='edge', alpha=0.6)
+    # The histogram counts every value; the KDE is fitted on a random subsample, which gives a visually identical curve.
+    kde_sample = np.random.default_rng(0).choice(values, size=min(self.KDE_SAMPLE_SIZE, values.size), replace=False)
+    if kde_sample.size > 1 and kde_sample.min() < kde_sample.max():
+      kde = gaussian_kde(kde_sample)
+      grid = np.linspace(edges[0], edges[-1], 200)
+      plt.plot(grid, kde(grid) * counts.sum() * (edges[1] - edges[0]))
     plt.title(f"Distribution of {feature}")
     plt.xlabel(feature)
     plt.ylabel("Frequency")
     plt.show()
 
+  def batch_analyze(self, df:pd.DataFrame, features:list, output_dir:str=".", n_jobs:int=-1):
+    """
+    Render histograms for several numerical features in parallel and save them as PNG files.
+
+    Parameters:
+    df (pd.DataFrame): The dataframe to analyze.
+    features (list): The numerical features to analyze.
+    output_dir (str): Directory the PNG files are written to.
+    n_jobs (int): Number of worker processes, -1 uses all cores.
+
+    Returns:
+    list: Paths of the written PNG files, in the order of features.
+    """
+    os.makedirs(output_dir, exist_ok=True)
+    return joblib.Parallel(n_jobs=n_jobs)(
+      joblib.delayed(_render_histogram)(
+        df[feature].to_numpy(dtype=np.float64, na_value=np.nan),
+        feature,
+        os.path.join(output_dir, f"{_FILENAME_UNSAFE.sub('_', feature)}_distribution.png"),
+      )
+      for feature in features
+    )
+
 
 # Concrete Class for categorical feature analysis Strategy
 # ---------------------------------------------------------
@@ -1,9 +1,28 @@
 import logging
 from abc import ABC, abstractmethod
+import numpy as np
 import pandas as pd
+import polars as pl
+import pyarrow as pa
 
 # Logging setup
-logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(messages)s")
+logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
+
+
+def _as_float(series: pd.Series) -> pd.Series:
+    """
+    Casts an integer column that has gaps (only possible with Arrow or nullable dtypes) to the matching float dtype,
+    as it would have been had it been read into NumPy.
+    """
+    return series.astype(pd.ArrowDtype(pa.float64()) if isinstance(series.dtype, pd.ArrowDtype) else "Float64")
+
+
+def _fits_integer_dtype(value, dtype) -> bool:
+    """Whether value is a whole number representable in the integer dtype."""
+    if isinstance(value, bool) or not float(value).is_integer():
+        return False
+    info = np.iinfo(dtype.numpy_dtype)
+    return info.min <= value <= info.max
 
 
 class MissingValueHandlingStrategy(ABC):
@@ -34,9 +53,27 @@ class DropMissingValuesStrategy(MissingValueHandlingStrategy):
         :param df: Input data frame.
         :return: Missing values handled DataFrame.
         """
-        logging.info(f"Dropping missing values with axis={self.axis} and thresh={self.thresh}")
-        df_cleaned = df.dropna(axis=self.axis, thresh=self.thresh)
-        logging.info(f"Missing values dropped.")
+        logging.info("Dropping missing values with axis=%s and thresh=%s", self.axis, self.thresh)
+        # Accept the same axis spellings as dropna ('index'/'rows'/'columns'); raises on anything else.
+        axis = df._get_axis_number(self.axis)
+        # Count nulls in Polars, which works off the Arrow validity bitmaps in parallel rather than building a pandas
+        # boolean mask first. Only the keep-mask comes back; selecting on df keeps its index and dtypes.
+        try:
+            pdf = pl.from_pandas(df) if df.shape[1] > 0 else None
+        except (ValueError, TypeError):
+            # Frames Polars can't represent (mixed-type object columns, duplicate column names) go through pandas.
+            pdf = None
+        if pdf is None:
+            df_cleaned = df.dropna(axis=axis, thresh=self.thresh)
+        elif axis == 0:
+            min_non_null = pdf.width if self.thresh is None else self.thresh
+            keep_rows = pdf.select(pl.sum_horizontal(pl.all().is_not_null()) >= min_non_null).to_series()
+            df_cleaned = df[keep_rows.to_numpy()]
+        else:
+            max_nulls = 0 if self.thresh is None else pdf.height - self.thresh
+            keep_columns = [i for i, column in enumerate(pdf.get_columns()) if column.null_count() <= max_nulls]
+            df_cleaned = df.iloc[:, keep_columns]
+        logging.info("Missing values dropped.")
         return df_cleaned
 
 
@@ -60,23 +97,69 @@ class FillMissingValuesStrategy(MissingValueHandlingStrategy):
         :param df: The input DataFrame containing missing values.
         :return: The DataFrame with missing values filled.
         """
-        logging.info(f"Filling missing values using method: {self.method}")
-        df_cleaned = df.copy()
-
-        if self.method == "mean":
-            numeric_columns = df_cleaned.select_dtypes(include='number').columns
-            df_cleaned[numeric_columns] = df_cleaned[numeric_columns].fillna(df_cleaned[numeric_columns].mean())
-
-        elif self.method == "median":
-            numeric_columns = df_cleaned.select_dtypes(include='number').columns
-            df_cleaned[numeric_columns] = df_cleaned[numeric_columns].fillna(df_cleaned[numeric_columns].median())
+        logging.info("Filling missing values using method: %s", self.method)
+
+        # Resolve the numeric columns once and share them across the fill methods.
+        numeric_columns = df.select_dtypes(include='number').columns
+
+        # If none of the columns this method fills has a gap (e.g. re-running mean/median/mode on already filled data,
+        # even when non-numeric columns still have NaNs), return the frame as-is without copying or aggregating.
+        target_columns = numeric_columns if self.method in ("mean", "median", "mode") else df.columns
+        if not df[target_columns].isna().to_numpy().any():
+            logging.info("No missing values found in the columns to fill, nothing to fill.")
+            return df
+
+        if self.method in ("mean", "median"):
+            # Only columns that actually have gaps are touched. Polars computes all their aggregates in one parallel
+            # pass; the fill itself stays in pandas so dtypes and the index of the other columns are left alone.
+            null_columns = numeric_columns[df[numeric_columns].isna().any().to_numpy()]
+            df_cleaned = df.copy()
+            # Gaps only in non-numeric columns: nothing for mean/median to fill (and no row to read aggregates from).
+            aggregates = {} if len(null_columns) == 0 else pl.from_pandas(df[null_columns]).select(
+                getattr(pl.all(), self.method)()
+            ).row(0, named=True)
+            for column in null_columns:
+                if pd.api.types.is_integer_dtype(df_cleaned[column].dtype):
+                    # A mean/median is generally fractional, so integer columns with gaps become float.
+                    df_cleaned[column] = _as_float(df_cleaned[column])
+            df_cleaned.fillna(
+                value={column: value for column, value in aggregates.items() if value is not None}, inplace=True
+            )
 
         elif self.method == "mode":
-            numeric_columns = df_cleaned.select_dtypes(include='number').columns
-            df_cleaned[numeric_columns] = df_cleaned[numeric_columns].fillna(df_cleaned[numeric_columns].mode())
+            # DataFrame.mode() returns one row per tied value, which fillna aligns on the index and mostly ignores.
+            # Fill each column with its first mode as a scalar instead.
+            modes = {}
+            for column in numeric_columns:
+                column_modes = df[column].mode(dropna=True)
+                if not column_modes.empty:
+                    modes[column] = column_modes.iat[0]
+            df_cleaned = df.copy()
+            df_cleaned.fillna(value=modes, inplace=True)
 
         elif self.method == "constant":
-            df_cleaned = df_cleaned.fillna(self.fill_value)
+            df_cleaned = df.copy()
+            for column in df_cleaned.columns[df_cleaned.isna().any().to_numpy()]:
+                series = df_cleaned[column]
+                if isinstance(series.dtype, pd.CategoricalDtype):
+                    # Categoricals only accept known categories, so register the fill value first.
+                    if self.fill_value not in series.cat.categories:
+                        series = series.cat.add_categories([self.fill_value])
+                    df_cleaned[column] = series.fillna(self.fill_value)
+                    continue
+                if (pd.api.types.is_integer_dtype(series.dtype) and isinstance(self.fill_value, (int, float, np.number))
+                        and not _fits_integer_dtype(self.fill_value, series.dtype)):
+                    # Arrow integers silently truncate fractional values and reject out-of-range ones.
+                    series = _as_float(series)
+                try:
+                    df_cleaned[column] = series.fillna(self.fill_value)
+                except (TypeError, ValueError, pa.ArrowInvalid):
+                    # Arrow-backed columns reject values of another type (e.g. 0 into strings); fall back to object,
+                    # which is what a NumPy-backed column would have become.
+                    df_cleaned[column] = series.astype(object).fillna(self.fill_value)
+
+        else:
+            df_cleaned = df.copy()
 
         logging.info("Missing values filled.")
         return df_cleaned
@@ -100,7 +183,7 @@ class MissingValueHandler:
         Parameters:
         strategy (MissingValueHandlingStrategy): The new strategy to be used for handling missing values.
         """
-        logging.info(f"Switching missing value handling strategy.")
+        logging.info("Switching missing value handling strategy.")
         self._strategy = strategy
 
     def handle_missing_values(self, df: pd.DataFrame):
@@ -1,8 +1,70 @@
-import os
 import zipfile
 from abc import ABC, abstractmethod
 import logging
+import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.csv as pv
+
+
+# pd.read_csv's default missing-value markers. PyArrow's own list differs (it lacks e.g. 'None' and '<NA>').
+_PANDAS_NA_VALUES = [
+    "", "#N/A", "#N/A N/A", "#NA", "-1.#IND", "-1.#QNAN", "-NaN", "-nan", "1.#IND", "1.#QNAN",
+    "<NA>", "N/A", "NA", "NULL", "NaN", "None", "n/a", "nan", "null",
+]
+
+# Narrower integer types tried in order when downcasting ingested columns.
+_INTEGER_DOWNCAST_TYPES = (pa.int8(), pa.int16(), pa.int32())
+
+
+def _downcast_numeric_columns(table: pa.Table) -> pa.Table:
+    """ Casts numeric columns to the narrowest type that holds their values without loss """
+    # Integers are narrowed on their min/max; float64 becomes float32 only if every value round-trips exactly.
+    for i, field in enumerate(table.schema):
+        column = table.column(i)
+        target = None
+        if pa.types.is_integer(field.type) and column.null_count < len(column):
+            bounds = pc.min_max(column)
+            low, high = bounds["min"].as_py(), bounds["max"].as_py()
+            for candidate in _INTEGER_DOWNCAST_TYPES:
+                if candidate.bit_width >= field.type.bit_width:
+                    break
+                info = np.iinfo(candidate.to_pandas_dtype())
+                if info.min <= low and high <= info.max:
+                    target = candidate
+                    break
+        elif pa.types.is_float64(field.type):
+            narrowed = pc.cast(column, pa.float32(), safe=False)
+            if pc.all(pc.equal(pc.cast(narrowed, pa.float64()), column)).as_py() is not False:
+                target = pa.float32()
+        if target is not None:
+            table = table.set_column(i, field.with_type(target), pc.cast(column, target))
+    return table
+
+
+# String columns with fewer distinct values than this fraction of rows are loaded as pandas categoricals.
+_CATEGORY_MAX_UNIQUE_RATIO = 0.5
+
+
+def _dictionary_encode_low_cardinality(table: pa.Table) -> pa.Table:
+    """ Dictionary-encodes low-cardinality string columns so pandas loads them as the category dtype """
+    for i, field in enumerate(table.schema):
+        if not (pa.types.is_string(field.type) or pa.types.is_large_string(field.type)):
+            continue
+        column = table.column(i)
+        n_unique = pc.count_distinct(column).as_py()
+        if n_unique and n_unique / len(column) < _CATEGORY_MAX_UNIQUE_RATIO:
+            encoded = pc.dictionary_encode(column)
+            table = table.set_column(i, field.with_type(encoded.type), encoded)
+    return table
+
+
+def _pandas_type(arrow_type: pa.DataType):
+    """ Maps Arrow types to pandas dtypes: dictionary columns become categoricals, everything else stays Arrow-backed """
+    if pa.types.is_dictionary(arrow_type):
+        return None
+    return pd.ArrowDtype(arrow_type)
 
 
 # Abstract class for data Ingestor (factory)
@@ -15,36 +77,52 @@ class DataIngestor(ABC):
 # Abstract class for data Ingestor (factory)
 class ZipDataIngestor(DataIngestor):
     def ingest(self, file_path: str) -> pd.DataFrame:
-        """ Extracts data from zip file and returns a pandas DataFrame """
+        """ Reads the csv file inside the zip archive and returns a pandas DataFrame """
 
-        if not file_path.endswith('.zip'):
+        if not file_path.lower().endswith('.zip'):
             raise ValueError("Provided file is not a .zip file.")
 
         with zipfile.ZipFile(file_path, 'r') as zip_ref:
-            zip_ref.extractall("extracted_data")
-
-        extracted_files = os.listdir("extracted_data")
-        print("extracted_files: ", extracted_files)
-        csv_files = [f for f in extracted_files if f.endswith('.csv')]
-        if len(csv_files) == 0:
-            raise FileNotFoundError("No csv files found in the zip file.")
-        elif len(csv_files) > 1:
-            raise ValueError("Multiple csv files found in the zip file please specify which one to use.")
-
-        csv_file_path = os.path.join("extracted_data", csv_files[0])
-        df = pd.read_csv(csv_file_path)
+            # Stream the csv straight out of the archive rather than extracting it to disk first. Only top-level,
+            # non-hidden members count, which skips macOS '__MACOSX/._<name>.csv' resource forks.
+            csv_members = [
+                m for m in zip_ref.infolist()
+                if not m.is_dir() and '/' not in m.filename and not m.filename.startswith('.')
+                and m.filename.endswith('.csv')
+            ]
+            print("csv_files: ", [m.filename for m in csv_members])
+            if len(csv_members) == 0:
+                raise FileNotFoundError("No csv files found in the zip file.")
+            elif len(csv_members) > 1:
+                raise ValueError("Multiple csv files found in the zip file please specify which one to use.")
+
+            # PyArrow's multithreaded C++ parser reads the CSV in large blocks, and the table is handed to pandas
+            # as Arrow-backed columns without a NumPy copy. Missing values use pd.read_csv's markers, strings included.
+            with zip_ref.open(csv_members[0]) as csv_file:
+                table = pv.read_csv(
+                    csv_file,
+                    read_options=pv.ReadOptions(use_threads=True, block_size=64 << 20),
+                    convert_options=pv.ConvertOptions(null_values=_PANDAS_NA_VALUES, strings_can_be_null=True),
+                )
+
+        table = _dictionary_encode_low_cardinality(_downcast_numeric_columns(table))
+        df = table.to_pandas(split_blocks=True, self_destruct=True, types_mapper=_pandas_type)
+        del table
         return df
 
 
 # Abstract class for factory
 class DataIngestorFactory:
+    # Lower-cased file extension (as returned by os.path.splitext) -> DataIngestor handling it.
+    _INGESTORS = {'.zip': ZipDataIngestor}
+
     @staticmethod
     def get_data_ingestor(file_extension: str) -> DataIngestor:
         """Returns the appropriate DataIngestor based on file extension."""
-        if file_extension == ".zip" or file_extension == 'zip':
-            return ZipDataIngestor()
-        else:
+        ingestor_class = DataIngestorFactory._INGESTORS.get(file_extension)
+        if ingestor_class is None:
             raise ValueError(f"No ingestor available for file extension: {file_extension}")
+        return ingestor_class()
 
 
 # Example usage
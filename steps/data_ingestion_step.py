@@ -1,3 +1,4 @@
+import os
 import pandas as pd
 from src.ingest_data import DataIngestorFactory
 from zenml import step
@@ -6,7 +7,7 @@ from zenml import step
 @step
 def data_ingestion_step(file_path: str) -> pd.DataFrame:
     # Get the file extension
-    file_extension = file_path.split('.')[-1]
+    file_extension = os.path.splitext(file_path)[1].lower()
 
     # Get the appropriate DataIngestor
     data_ingestor = DataIngestorFactory.get_data_ingestor(file_extension)